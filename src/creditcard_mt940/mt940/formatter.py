@@ -17,9 +17,14 @@ class Transaction:
     transaction_type: str = "TRANSFER"  # CARD, TRANSFER, DIRECT_DEBIT, CREDIT
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AccountStatement:
-    """Represents an account statement."""
+    """Represents an account statement.
+
+    Frozen with slots: statements are built once per conversion and only
+    read by the formatters, so the fields pack into a slot array instead
+    of a per-instance dict.
+    """
     account_number: str
     statement_number: str
     opening_balance: Decimal
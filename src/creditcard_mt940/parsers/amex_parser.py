@@ -1,13 +1,33 @@
 """AMEX credit card Excel parser with payment reversal logic."""
 
+import re
+
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from decimal import Decimal
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 from .base_parser import BaseParser
 from ..mt940.formatter import Transaction
 
+# Date formats tried in order; hoisted so the per-row hot path does not
+# rebuild the list on every call
+_DATE_FORMATS = ('%Y-%m-%d', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y')
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Parse a date string against the known formats; memoized because
+    statements repeat the same handful of dates across many rows."""
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
 
 class AmexParser(BaseParser):
     """Parser for AMEX credit card Excel files."""
@@ -15,6 +35,11 @@ class AmexParser(BaseParser):
     def __init__(self):
         super().__init__()
         self.payment_keywords = ["hartelijk bedankt voor uw betaling"]
+        # Compiled once; IGNORECASE search beats lowercasing every
+        # description just to run substring checks
+        self._payment_re = re.compile(
+            '|'.join(map(re.escape, self.payment_keywords)), re.IGNORECASE
+        )
     
     def get_bank_name(self) -> str:
         return "AMEX"
@@ -71,16 +96,26 @@ class AmexParser(BaseParser):
             if role and role not in self._col_indices:
                 self._col_indices[role] = idx
         
+        # Clean the primary amount column (index 2) in one vectorized pass;
+        # rows the bulk clean cannot handle fall back to _clean_amount
+        amounts = {}
+        if df.shape[1] > 2:
+            amounts = {
+                idx: value
+                for idx, value in zip(df.index, self._clean_amount_series(df.iloc[:, 2]))
+                if value is not None
+            }
+
         for index, row in df.iterrows():
             # Skip empty rows
             if pd.isna(row.iloc[0]) or str(row.iloc[0]).strip() == '':
                 continue
-            
+
             # Try to extract transaction data (AMEX format can vary)
-            transaction = self._parse_amex_row(row, index)
+            transaction = self._parse_amex_row(row, index, amount=amounts.get(index))
             if transaction:
                 transactions.append(transaction)
-        
+
         return transactions
     
     def _find_header_row(self, df: pd.DataFrame) -> int:
@@ -95,8 +130,12 @@ class AmexParser(BaseParser):
         
         return None
     
-    def _parse_amex_row(self, row: pd.Series, index: int) -> Transaction:
-        """Parse a single AMEX row into a Transaction."""
+    def _parse_amex_row(self, row: pd.Series, index: int, amount: Decimal = None) -> Transaction:
+        """Parse a single AMEX row into a Transaction.
+
+        A pre-cleaned amount from the vectorized pass in parse_file may be
+        supplied; otherwise the per-row fallback scan runs.
+        """
         try:
             # AMEX Excel structure: assume standard format with amount in column 3 (index 2)
             # Try to identify date column (usually first column)
@@ -118,9 +157,8 @@ class AmexParser(BaseParser):
                 return None
             
             # Amount is expected to be in column 3 (index 2) - the "Bedrag" column
-            amount = None
             amount_col_idx = 2
-            if len(row) > amount_col_idx and pd.notna(row.iloc[amount_col_idx]):
+            if amount is None and len(row) > amount_col_idx and pd.notna(row.iloc[amount_col_idx]):
                 try:
                     amount = self._clean_amount(row.iloc[amount_col_idx])
                 except:
@@ -187,32 +225,42 @@ class AmexParser(BaseParser):
     
     def _apply_amex_logic(self, amount: Decimal, description: str) -> tuple:
         """Apply AMEX-specific business logic with Rabobank-compatible transaction types."""
-        description_lower = description.lower()
-        
         # Check if this is a payment to AMEX (should be positive)
-        if any(keyword in description_lower for keyword in self.payment_keywords):
+        if self._payment_re.search(description):
             return abs(amount), "CREDIT"  # Make positive, keep as CREDIT
         
         # All other transactions should have their sign flipped (+ becomes -, - becomes +)
         return -amount, "TRANSFER"  # Flip sign, use TRANSFER for N544 code like Rabobank
+
+    def _apply_amex_logic_vec(self, amounts: pd.Series, descriptions: pd.Series) -> tuple:
+        """Vectorized _apply_amex_logic over whole columns.
+
+        One regex scan marks the payment rows; np.where then selects
+        abs/flip and CREDIT/TRANSFER per element without row dispatch.
+        """
+        is_payment = descriptions.str.contains(self._payment_re, na=False)
+        processed = pd.Series(
+            np.where(is_payment, amounts.abs(), -amounts), index=amounts.index
+        )
+        types = pd.Series(
+            np.where(is_payment, "CREDIT", "TRANSFER"), index=amounts.index
+        )
+        return processed, types
     
     def _parse_date(self, date_value) -> datetime:
         """Parse date from various formats."""
+        if isinstance(date_value, pd.Timestamp):
+            return date_value.to_pydatetime()
         if isinstance(date_value, datetime):
             return date_value
         elif pd.isna(date_value):
             raise ValueError("Date value is NaN")
-        
-        # Convert to string and try different formats
-        date_str = str(date_value).strip()
-        
-        # Try common date formats
-        for date_format in ['%Y-%m-%d', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y', '%d-%m-%Y']:
-            try:
-                return datetime.strptime(date_str, date_format)
-            except ValueError:
-                continue
-        
+
+        # Convert to string and try the known formats
+        date = _parse_date_str(str(date_value).strip())
+        if date is not None:
+            return date
+
         # Try pandas timestamp parsing as fallback
         try:
             return pd.to_datetime(date_value).to_pydatetime()
@@ -238,6 +286,24 @@ class AmexParser(BaseParser):
         
         return Decimal(cleaned)
     
+    def _clean_amount_series(self, amounts: pd.Series) -> List[Optional[Decimal]]:
+        """Batched _clean_amount over a whole column.
+
+        One vectorized clean plus a fullmatch validity scan replace the
+        per-row string surgery; Decimals come straight from the cleaned
+        strings (never through float) and unparseable entries map to None.
+        """
+        cleaned = (
+            amounts.astype(str).str.strip()
+            .str.replace(',', '.', regex=False)
+            .str.replace(r'[^0-9.\-]', '', regex=True)
+        )
+        ok = amounts.notna() & cleaned.str.fullmatch(r'-?(\d+(\.\d*)?|\.\d+)', na=False)
+        return [
+            Decimal(value) if good else None
+            for value, good in zip(cleaned.tolist(), ok.tolist())
+        ]
+
     def _looks_like_date_or_amount(self, text: str) -> bool:
         """Check if text looks like a date or amount."""
         # Check if it looks like an amount (has digits and decimal/comma)
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from ..mt940.formatter import Transaction
 
 
@@ -38,15 +38,40 @@ class BaseParser(ABC):
         """Validate file format and return validation results."""
         pass
     
-    def calculate_totals(self, transactions: List[Transaction]) -> Dict:
-        """Calculate transaction totals (common across all banks)."""
-        total_credits = sum(t.amount for t in transactions if t.amount > 0)
-        total_debits = sum(t.amount for t in transactions if t.amount < 0)
+    def parse_with_info(self, file_path: str) -> tuple:
+        """Parse a file once and return (transactions, account_info).
+
+        The default falls back to the two separate methods; parsers whose
+        reads are expensive override this to load the file a single time.
+        """
+        return self.parse_file(file_path), self.get_account_info(file_path)
+
+    def iter_transactions(self, file_path: str) -> Iterator[Transaction]:
+        """Yield transactions one at a time.
+
+        Subclasses that can stream may override this; the default simply
+        iterates the fully-parsed list from parse_file.
+        """
+        yield from self.parse_file(file_path)
+
+    def calculate_totals(self, transactions: Iterable[Transaction]) -> Dict:
+        """Calculate transaction totals (common across all banks).
+
+        Single pass, so it accepts a generator as well as a list.
+        """
+        total_credits = total_debits = 0
+        transaction_count = 0
+        for transaction in transactions:
+            transaction_count += 1
+            if transaction.amount > 0:
+                total_credits += transaction.amount
+            elif transaction.amount < 0:
+                total_debits += transaction.amount
         net_total = total_credits + total_debits
-        
+
         return {
             'total_credits': total_credits,
             'total_debits': total_debits,
             'net_total': net_total,
-            'transaction_count': len(transactions)
+            'transaction_count': transaction_count
         }
\ No newline at end of file
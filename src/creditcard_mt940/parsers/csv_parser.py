@@ -1,13 +1,17 @@
 """CSV parser for credit card transactions with business rules."""
 
+import logging
+
 import pandas as pd
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import List, Optional
 from dataclasses import dataclass
 
 from ..mt940.formatter import Transaction
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RawTransaction:
@@ -33,14 +37,26 @@ class CSVParser:
     def parse_csv(self, file_path: str) -> List[Transaction]:
         """Parse CSV file and return list of transactions."""
         df = pd.read_csv(file_path, sep=';', encoding='utf-8')
-        
+
         # Parse raw transactions
         raw_transactions = self._parse_raw_transactions(df)
-        
+
         # Apply business rules
         processed_transactions = self._apply_business_rules(raw_transactions)
-        
+
         return processed_transactions
+
+    def parse_with_info(self, file_path: str) -> tuple:
+        """Parse the CSV once and return (transactions, account_info).
+
+        Callers that need both the transactions and the account metadata
+        would otherwise read and parse the file twice via parse_csv +
+        get_account_info.
+        """
+        df = pd.read_csv(file_path, sep=';', encoding='utf-8')
+        raw_transactions = self._parse_raw_transactions(df)
+        transactions = self._apply_business_rules(raw_transactions)
+        return transactions, self._account_info_from_df(df)
     
     def _parse_raw_transactions(self, df: pd.DataFrame) -> List[RawTransaction]:
         """Parse raw transactions from DataFrame."""
@@ -56,15 +72,15 @@ class CSVParser:
             try:
                 date = datetime.strptime(date_str, '%d-%m-%Y')
             except ValueError:
-                print(f"Warning: Invalid date format in row {index}: {date_str}")
+                logger.warning("Invalid date format in row %s: %s", index, date_str)
                 continue
             
             # Parse amount (European format with comma as decimal separator)
             amount_str = str(row['Bedrag']).replace(',', '.')
             try:
                 amount = Decimal(amount_str)
-            except:
-                print(f"Warning: Invalid amount format in row {index}: {amount_str}")
+            except (InvalidOperation, ValueError, TypeError):
+                logger.warning("Invalid amount format in row %s: %s", index, amount_str)
                 continue
             
             # Parse description
@@ -82,7 +98,7 @@ class CSVParser:
             if pd.notna(row.get('Oorspr bedrag')) and str(row['Oorspr bedrag']).strip():
                 try:
                     original_amount = Decimal(str(row['Oorspr bedrag']).replace(',', '.'))
-                except:
+                except (InvalidOperation, ValueError, TypeError):
                     pass
             
             if pd.notna(row.get('Oorspr munt')) and str(row['Oorspr munt']).strip():
@@ -91,7 +107,7 @@ class CSVParser:
             if pd.notna(row.get('Koers')) and str(row['Koers']).strip():
                 try:
                     exchange_rate = Decimal(str(row['Koers']).replace(',', '.'))
-                except:
+                except (InvalidOperation, ValueError, TypeError):
                     pass
             
             raw_transaction = RawTransaction(
@@ -212,24 +228,26 @@ class CSVParser:
     def get_account_info(self, file_path: str) -> dict:
         """Extract account information from CSV."""
         df = pd.read_csv(file_path, sep=';', encoding='utf-8')
-        
+        return self._account_info_from_df(df)
+
+    def _account_info_from_df(self, df: pd.DataFrame) -> dict:
+        """Compute account info from an already-parsed DataFrame."""
         # Get account number from first row
         account_number = str(df.iloc[0]['Tegenrekening IBAN']).strip()
-        
-        # Get date range
-        dates = []
-        for _, row in df.iterrows():
-            if pd.notna(row.get('Datum')):
-                try:
-                    date_str = str(row['Datum']).strip()
-                    date = datetime.strptime(date_str, '%d-%m-%Y')
-                    dates.append(date)
-                except ValueError:
-                    continue
-        
-        min_date = min(dates) if dates else datetime.now()
-        max_date = max(dates) if dates else datetime.now()
-        
+
+        # Date range via vectorized reductions instead of per-row strptime
+        dates = pd.Series(dtype='datetime64[ns]')
+        if 'Datum' in df.columns:
+            dates = pd.to_datetime(
+                df['Datum'].astype(str).str.strip(), format='%d-%m-%Y', errors='coerce'
+            ).dropna()
+
+        if len(dates):
+            min_date = dates.min().to_pydatetime()
+            max_date = dates.max().to_pydatetime()
+        else:
+            min_date = max_date = datetime.now()
+
         return {
             'account_number': account_number,
             'start_date': min_date,
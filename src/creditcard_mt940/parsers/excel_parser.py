@@ -30,11 +30,23 @@ class ExcelParser(BaseParser):
 
     def parse_file(self, file_path: str) -> List[Transaction]:
         """Parse Excel template file and return list of transactions."""
+        return self._build_transactions(self._load_df(file_path))
+
+    def parse_with_info(self, file_path: str) -> tuple:
+        """Decompress and parse the workbook once for both results."""
+        df = self._load_df(file_path)
+        return self._build_transactions(df), self._account_info_from_df(df)
+
+    def _load_df(self, file_path: str) -> pd.DataFrame:
+        """Read the workbook and normalize column names."""
         df = pd.read_excel(file_path)
 
         # Normalize column names (strip whitespace)
         df.columns = [col.strip() for col in df.columns]
+        return df
 
+    def _build_transactions(self, df: pd.DataFrame) -> List[Transaction]:
+        """Build transactions from an already-loaded DataFrame."""
         transactions = []
 
         for index, row in df.iterrows():
@@ -120,9 +132,10 @@ class ExcelParser(BaseParser):
 
     def get_account_info(self, file_path: str) -> dict:
         """Extract account information from Excel file."""
-        df = pd.read_excel(file_path)
-        df.columns = [col.strip() for col in df.columns]
+        return self._account_info_from_df(self._load_df(file_path))
 
+    def _account_info_from_df(self, df: pd.DataFrame) -> dict:
+        """Compute account info from an already-loaded DataFrame."""
         dates = []
         for _, row in df.iterrows():
             if pd.notna(row.get("Datum")):
@@ -1,16 +1,21 @@
 """ICS credit card CSV parser with sign flipping logic."""
 
+import logging
+import re
+
 import pandas as pd
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import List, Optional
 from dataclasses import dataclass
 
-from .base_parser import BaseParser
+from .csv_base import CsvParser
 from ..mt940.formatter import Transaction
 
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(slots=True)
 class RawTransaction:
     """Raw transaction data from ICS CSV."""
     transaction_date: datetime
@@ -28,123 +33,189 @@ class RawTransaction:
     wallet_provider: Optional[str] = None
 
 
-class IcsParser(BaseParser):
+class IcsParser(CsvParser):
     """Parser for ICS credit card CSV files with sign flipping logic."""
-    
+
+    delimiter = ';'
+    date_format = '%d-%m-%Y'
+    date_column = 'Transactiedatum'
+    amount_column = 'Bedrag'
+    required_columns = (
+        'Transactiedatum',
+        'Omschrijving',
+        'Debit/Credit',
+        'Bedrag',
+    )
+
     def __init__(self):
         super().__init__()
         self.settlement_keywords = ["geincasseerd vorig saldo", "verrekening vorig saldo"]
-    
+        # One compiled case-insensitive pattern instead of N substring scans
+        self._settlement_re = re.compile(
+            '|'.join(map(re.escape, self.settlement_keywords)), re.IGNORECASE
+        )
+
     def get_bank_name(self) -> str:
         return "ICS"
-    
-    def get_supported_file_types(self) -> List[str]:
-        return ["csv"]
-    
-    def parse_file(self, file_path: str) -> List[Transaction]:
-        """Parse ICS CSV file and return list of transactions."""
-        # Try different encodings for ICS files
-        for encoding in ['utf-8', 'latin-1', 'cp1252', 'utf-8-sig']:
-            try:
-                df = pd.read_csv(file_path, sep=';', encoding=encoding)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            raise ValueError("Could not decode CSV file with any supported encoding")
-        
-        # Clean column names (remove BOM and whitespace issues)
-        df.columns = [col.replace('\ufeff', '').replace('\xa0', ' ').strip() for col in df.columns]
-        
-        # Parse raw transactions
+
+    def _build_transactions(self, df: pd.DataFrame) -> List[Transaction]:
+        """Parse raw transactions and apply ICS-specific business rules."""
         raw_transactions = self._parse_raw_transactions(df)
-        
-        # Apply ICS-specific business rules
-        processed_transactions = self._apply_business_rules(raw_transactions)
-        
-        return processed_transactions
+        return self._apply_business_rules(raw_transactions)
     
     def _parse_raw_transactions(self, df: pd.DataFrame) -> List[RawTransaction]:
         """Parse raw transactions from DataFrame."""
         raw_transactions = []
-        
-        for index, row in df.iterrows():
-            # Skip empty rows or rows with missing essential data
-            if pd.isna(row.get('Omschrijving', '')) or pd.isna(row.get('Bedrag', '')):
-                continue
-                
-            # Parse transaction date (DD-MM-YYYY format)
-            trans_date_str = str(row['Transactiedatum']).strip()
-            try:
-                transaction_date = datetime.strptime(trans_date_str, '%d-%m-%Y')
-            except ValueError:
-                print(f"Warning: Invalid transaction date format in row {index}: {trans_date_str}")
-                continue
-            
-            # Parse booking date (DD-MM-YYYY format)
-            booking_date_str = str(row['Boekingsdatum']).strip()
-            try:
-                booking_date = datetime.strptime(booking_date_str, '%d-%m-%Y')
-            except ValueError:
-                booking_date = transaction_date  # Fallback to transaction date
-            
-            # Parse amount (European format with comma as decimal separator and dot as thousand separator)
-            amount_str = str(row['Bedrag']).strip()
-            # Handle European format: 1.234,56 -> 1234.56
-            if ',' in amount_str and '.' in amount_str:
-                # Both comma and dot present: dot is thousands separator, comma is decimal
-                amount_str = amount_str.replace('.', '').replace(',', '.')
-            elif ',' in amount_str:
-                # Only comma present: comma is decimal separator
-                amount_str = amount_str.replace(',', '.')
-            
-            try:
-                amount = Decimal(amount_str)
-            except:
-                print(f"Warning: Invalid amount format in row {index}: {amount_str}")
-                continue
-            
-            # Parse description
-            description = str(row['Omschrijving']).strip()
-            
+
+        if 'Omschrijving' not in df.columns or 'Bedrag' not in df.columns:
+            return []
+
+        # Drop rows with missing essential data with one mask instead of per-row checks
+        work = df[df['Omschrijving'].notna() & df['Bedrag'].notna()]
+        if len(work) == 0:
+            return []
+
+        # Vectorized parsing of the hot columns: dates, amounts, descriptions
+        trans_date_strs = work['Transactiedatum'].astype(str).str.strip()
+        trans_dates = pd.to_datetime(trans_date_strs, format='%d-%m-%Y', errors='coerce')
+
+        if 'Boekingsdatum' in work.columns:
+            booking_dates = pd.to_datetime(
+                work['Boekingsdatum'].astype(str).str.strip(), format='%d-%m-%Y', errors='coerce'
+            )
+        else:
+            booking_dates = pd.Series(pd.NaT, index=work.index)
+
+        # European amount format in bulk: drop thousands dots where both
+        # separators are present, then comma becomes the decimal point
+        amount_strs = work['Bedrag'].astype(str).str.strip()
+        both_separators = amount_strs.str.contains(',') & amount_strs.str.contains('.', regex=False)
+        amount_strs = amount_strs.where(~both_separators, amount_strs.str.replace('.', '', regex=False))
+        amount_strs = amount_strs.str.replace(',', '.', regex=False)
+
+        descriptions = work['Omschrijving'].astype(str).str.strip()
+
+        # Deferred, lazily-formatted warnings instead of a print per bad row
+        bad_dates = work.index[trans_dates.isna()]
+        if len(bad_dates):
+            logger.warning(
+                "%d rows had invalid transaction dates, e.g. %s",
+                len(bad_dates),
+                [(index, trans_date_strs.loc[index]) for index in bad_dates[:5]]
+            )
+
+        keep = trans_dates.notna()
+
+        # Validate amounts in one vectorized scan, then construct every
+        # Decimal from the pre-cleaned strings in a single batch - no
+        # per-row replace/try-except left in the loop
+        amount_ok = amount_strs.str.fullmatch(r'[+-]?(\d+(\.\d*)?|\.\d+)', na=False)
+        bad_amounts = work.index[keep & ~amount_ok]
+        if len(bad_amounts):
+            logger.warning(
+                "%d rows had invalid amounts, e.g. %s",
+                len(bad_amounts),
+                [(index, amount_strs.loc[index]) for index in bad_amounts[:5]]
+            )
+        keep &= amount_ok
+
+        work = work[keep]
+        trans_dates_list = [d.to_pydatetime() for d in trans_dates[keep]]
+        booking_dates_list = [
+            b.to_pydatetime() if pd.notna(b) else None for b in booking_dates[keep]
+        ]
+        amounts_list = list(map(Decimal, amount_strs[keep]))
+        descriptions_list = descriptions[keep].tolist()
+
+        # Optional columns: one notna/non-empty mask per column up front, so
+        # the row loop never calls pd.notna on scalars
+        n_rows = len(work)
+
+        def optional_text_list(name):
+            if name not in work.columns:
+                return [None] * n_rows
+            col = work[name]
+            vals = col.astype(str).str.strip()
+            ok = (col.notna() & (vals != '')).tolist()
+            return [v if good else None for v, good in zip(vals.tolist(), ok)]
+
+        merchant_categories = optional_text_list('Merchant categorie')
+        countries = optional_text_list('Land')
+        transaction_types = optional_text_list('Type transactie')
+        wallet_providers = [
+            v if v != 'null' else None for v in optional_text_list('WalletProvider')
+        ]
+
+        if 'Bedrag in oorspronkelijke valuta' in work.columns:
+            orig_strs = (
+                work['Bedrag in oorspronkelijke valuta']
+                .astype(str).str.strip().str.replace(',', '.', regex=False)
+            )
+            original_amounts = []
+            for value, good in zip(orig_strs.tolist(),
+                                   (work['Bedrag in oorspronkelijke valuta'].notna()
+                                    & (orig_strs != '')).tolist()):
+                if good:
+                    try:
+                        original_amounts.append(Decimal(value))
+                        continue
+                    except InvalidOperation:
+                        pass
+                original_amounts.append(None)
+        else:
+            original_amounts = [None] * n_rows
+
+        # Resolve column positions once; itertuples rows are plain tuples, so
+        # no per-row Series gets allocated
+        positions = {name: work.columns.get_loc(name) for name in work.columns}
+
+        def cell(row, name, default=None):
+            idx = positions.get(name)
+            # Offset by one for the index element at row[0]
+            return row[idx + 1] if idx is not None else default
+
+        for i, row in enumerate(work.itertuples(index=True, name=None)):
+            transaction_date = trans_dates_list[i]
+            # Fallback to transaction date when the booking date is unparseable
+            booking_date = booking_dates_list[i] or transaction_date
+            description = descriptions_list[i]
+            amount = amounts_list[i]
+
             # Parse debit/credit indicator
-            debit_credit = str(row.get('Debit/Credit', '')).strip().upper()
-            
-            # Parse optional fields
-            original_amount = None
-            if pd.notna(row.get('Bedrag in oorspronkelijke valuta')) and str(row['Bedrag in oorspronkelijke valuta']).strip():
-                try:
-                    original_amount = Decimal(str(row['Bedrag in oorspronkelijke valuta']).replace(',', '.'))
-                except:
-                    pass
-            
+            debit_credit = str(cell(row, 'Debit/Credit', '')).strip().upper()
+
             raw_transaction = RawTransaction(
                 transaction_date=transaction_date,
                 booking_date=booking_date,
                 description=description,
-                cardholder_name=str(row.get('Naam Card-houder', '')).strip(),
-                card_number=str(row.get('Card nummer', '')).strip(),
+                cardholder_name=str(cell(row, 'Naam Card-houder', '')).strip(),
+                card_number=str(cell(row, 'Card nummer', '')).strip(),
                 debit_credit=debit_credit,
                 amount=amount,
-                merchant_category=str(row.get('Merchant categorie', '')).strip() if pd.notna(row.get('Merchant categorie')) else None,
-                country=str(row.get('Land', '')).strip() if pd.notna(row.get('Land')) else None,
-                currency=str(row.get('Valuta', 'EUR')).strip(),
-                original_amount=original_amount,
-                transaction_type=str(row.get('Type transactie', '')).strip() if pd.notna(row.get('Type transactie')) else None,
-                wallet_provider=str(row.get('WalletProvider', '')).strip() if pd.notna(row.get('WalletProvider')) and str(row.get('WalletProvider')).strip() != 'null' else None
+                merchant_category=merchant_categories[i],
+                country=countries[i],
+                currency=str(cell(row, 'Valuta', 'EUR')).strip(),
+                original_amount=original_amounts[i],
+                transaction_type=transaction_types[i],
+                wallet_provider=wallet_providers[i]
             )
-            
+
             raw_transactions.append(raw_transaction)
-        
+
         return raw_transactions
     
     def _apply_business_rules(self, raw_transactions: List[RawTransaction]) -> List[Transaction]:
         """Apply ICS-specific business rules with sign flipping."""
         processed_transactions = []
-        
+
+        # One vectorized scan over the description column instead of a
+        # per-transaction settlement keyword check
+        descriptions = pd.Series([t.description for t in raw_transactions])
+        is_settlement = descriptions.str.contains(self._settlement_re, na=False)
+
         for i, raw_transaction in enumerate(raw_transactions):
             # Check if this is a settlement from previous statement
-            if self._is_previous_statement_settlement(raw_transaction):
+            if is_settlement.iat[i]:
                 # Settlements should be positive (already handled by sign flipping logic)
                 processed_amount, transaction_type = self._apply_ics_sign_logic(raw_transaction)
                 
@@ -199,137 +270,42 @@ class IcsParser(BaseParser):
     
     def _is_previous_statement_settlement(self, transaction: RawTransaction) -> bool:
         """Check if transaction is a settlement from previous statement."""
-        description_lower = transaction.description.lower()
-        return any(keyword in description_lower for keyword in self.settlement_keywords)
+        return bool(self._settlement_re.search(transaction.description))
     
     def get_account_info(self, file_path: str) -> dict:
         """Extract account information from ICS CSV."""
-        # Try different encodings for ICS files
-        for encoding in ['utf-8', 'latin-1', 'cp1252', 'utf-8-sig']:
-            try:
-                df = pd.read_csv(file_path, sep=';', encoding=encoding)
-                break
-            except UnicodeDecodeError:
-                continue
+        df = self._load_df(file_path)
+
+        # Date range via vectorized reductions instead of per-row parsing
+        dates = pd.Series(dtype='datetime64[ns]')
+        if 'Transactiedatum' in df.columns:
+            dates = pd.to_datetime(df['Transactiedatum'], format='%d-%m-%Y', errors='coerce').dropna()
+        if len(dates):
+            min_date = dates.min().to_pydatetime()
+            max_date = dates.max().to_pydatetime()
         else:
-            raise ValueError("Could not decode CSV file with any supported encoding")
-        
-        # Clean column names
-        df.columns = [col.replace('\ufeff', '').replace('\xa0', ' ').strip() for col in df.columns]
-        
-        # Try to extract dates to determine range
-        dates = []
-        for _, row in df.iterrows():
-            if pd.notna(row.get('Transactiedatum')):
-                try:
-                    date_str = str(row['Transactiedatum']).strip()
-                    date = datetime.strptime(date_str, '%d-%m-%Y')
-                    dates.append(date)
-                except ValueError:
-                    continue
-        
-        min_date = min(dates) if dates else datetime.now()
-        max_date = max(dates) if dates else datetime.now()
-        
+            min_date = max_date = datetime.now()
+
         # Use first card number found for account
         account_number = "NL00ICS0000000000"  # Default
-        for _, row in df.iterrows():
-            if pd.notna(row.get('Card nummer')):
-                card_num = str(row['Card nummer']).strip()
-                account_number = f"NL00ICS0{card_num.replace('*', '0')}"
-                break
-        
+        if 'Card nummer' in df.columns:
+            card_numbers = df['Card nummer'].dropna().astype(str).str.strip()
+            if len(card_numbers):
+                account_number = f"NL00ICS0{card_numbers.iloc[0].replace('*', '0')}"
+
         return {
             'account_number': account_number,
             'start_date': min_date,
             'end_date': max_date
         }
     
-    def validate_file_format(self, file_path: str) -> dict:
-        """Validate ICS CSV file format and return validation results."""
-        try:
-            import pandas as pd
-            
-            # Try to read the CSV with different encodings
-            for encoding in ['utf-8', 'latin-1', 'cp1252', 'utf-8-sig']:
-                try:
-                    df = pd.read_csv(file_path, sep=';', encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                return {
-                    'valid': False,
-                    'error': "Could not decode CSV file with any supported encoding",
-                    'columns_found': []
-                }
-            
-            # Clean column names
-            df.columns = [col.replace('\ufeff', '').replace('\xa0', ' ').strip() for col in df.columns]
-            
-            # Check required columns for ICS format
-            required_columns = [
-                'Transactiedatum',
-                'Omschrijving',
-                'Debit/Credit', 
-                'Bedrag'
-            ]
-            
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            
-            if missing_columns:
-                return {
-                    'valid': False,
-                    'error': f"Missing required columns: {', '.join(missing_columns)}",
-                    'columns_found': list(df.columns)
-                }
-            
-            # Check if we have any data
-            if len(df) == 0:
-                return {
-                    'valid': False,
-                    'error': "CSV file is empty",
-                    'columns_found': list(df.columns)
-                }
-            
-            # Try to parse a few transactions to check format
-            validation_errors = []
-            
-            for index, row in df.head(5).iterrows():
-                # Check date format (DD-MM-YYYY)
-                try:
-                    datetime.strptime(str(row['Transactiedatum']), '%d-%m-%Y')
-                except ValueError:
-                    validation_errors.append(f"Invalid date format in row {index}: {row['Transactiedatum']}")
-                
-                # Check amount format
-                try:
-                    Decimal(str(row['Bedrag']).replace(',', '.'))
-                except:
-                    validation_errors.append(f"Invalid amount format in row {index}: {row['Bedrag']}")
-                
-                # Check debit/credit indicator
-                debit_credit = str(row.get('Debit/Credit', '')).strip().upper()
-                if debit_credit not in ['D', 'C']:
-                    validation_errors.append(f"Invalid Debit/Credit indicator in row {index}: {debit_credit}")
-            
-            if validation_errors:
-                return {
-                    'valid': False,
-                    'error': "Format validation errors: " + "; ".join(validation_errors),
-                    'columns_found': list(df.columns)
-                }
-            
-            return {
-                'valid': True,
-                'message': f"ICS CSV file is valid with {len(df)} transactions",
-                'columns_found': list(df.columns),
-                'row_count': len(df)
-            }
-            
-        except Exception as e:
-            return {
-                'valid': False,
-                'error': f"Error reading ICS CSV file: {str(e)}",
-                'columns_found': []
-            }
\ No newline at end of file
+    def _validate_sample_row(self, index: int, row: pd.Series) -> List[str]:
+        """Validate date, amount, and the ICS Debit/Credit indicator."""
+        errors = super()._validate_sample_row(index, row)
+
+        # Check debit/credit indicator
+        debit_credit = str(row.get('Debit/Credit', '')).strip().upper()
+        if debit_credit not in ['D', 'C']:
+            errors.append(f"Invalid Debit/Credit indicator in row {index}: {debit_credit}")
+
+        return errors
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Parser factory for selecting the appropriate bank parser."""
 
+import csv
+
 from typing import Dict, Type
 from .base_parser import BaseParser
 from .rabobank_old_parser import RabobankParser as RabobankOldParser
@@ -58,8 +60,34 @@ class ParserFactory:
         parser = self.create_parser(bank)
         return parser.get_supported_file_types()
     
+    # Signature columns that uniquely identify each bank's CSV header
+    _HEADER_SIGNATURES = [
+        ('ing', {'Accountnummer', 'Kaartnummer', 'Bedrag in EUR'}),
+        ('ics', {'Transactiedatum', 'Debit/Credit', 'Bedrag'}),
+        ('rabobank_new', {'Counterpty IBAN', 'Transaction Reference', 'Amount'}),
+        ('rabobank_new', {'Tegenrekening IBAN', 'Creditcard Nummer', 'Bedrag'}),
+        ('rabobank_old', {'Tegenrekening IBAN', 'Transactiereferentie', 'Bedrag'}),
+    ]
+
     def detect_bank_from_file(self, file_path: str) -> str:
-        """Try to automatically detect the bank from the file format (optional feature)."""
-        # This could be implemented to auto-detect based on file structure
-        # For now, we require explicit bank selection
-        raise NotImplementedError("Auto-detection not implemented - please select bank manually")
\ No newline at end of file
+        """Detect the bank by sniffing the CSV header line for signature columns."""
+        # Read just the first line; tolerate non-UTF8 exports
+        with open(file_path, 'rb') as f:
+            first_line = f.readline()
+        try:
+            header = first_line.decode('utf-8')
+        except UnicodeDecodeError:
+            header = first_line.decode('cp1252')
+
+        # Tokenize with the stdlib csv reader for both separators so quoted
+        # headers are handled correctly, then canonicalize names (BOM/nbsp)
+        columns = set()
+        for sep in (';', ','):
+            for col in next(csv.reader([header], delimiter=sep), []):
+                columns.add(col.replace('\ufeff', '').replace('\xa0', ' ').strip())
+
+        for bank, signature in self._HEADER_SIGNATURES:
+            if signature <= columns:
+                return bank
+
+        raise ValueError("Could not detect bank from file header - please select bank manually")
\ No newline at end of file
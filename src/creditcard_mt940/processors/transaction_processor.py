@@ -1,5 +1,11 @@
 """Transaction processor that coordinates CSV parsing and MT940 formatting."""
 
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
@@ -7,7 +13,44 @@ from typing import List, Optional
 from ..parsers.parser_factory import ParserFactory
 from ..parsers.base_parser import BaseParser
 from ..mt940.formatter import MT940Formatter, Transaction, AccountStatement
-from ..camt.formatter import CAMT053Formatter
+
+# Decimal is immutable, so one shared zero avoids re-parsing the literal
+# on every conversion
+_ZERO_BALANCE = Decimal('0.00')
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionSummary:
+    """Typed summary of a parsed statement file."""
+    account_number: str
+    start_date: datetime
+    end_date: datetime
+    transaction_count: int
+    total_credits: Decimal
+    total_debits: Decimal
+    net_total: Decimal
+    transactions: List[Transaction]
+
+    def to_dict(self) -> dict:
+        """Dict form used at the presentation/JSON boundary."""
+        return {
+            'account_number': self.account_number,
+            'date_range': {
+                'start': self.start_date,
+                'end': self.end_date
+            },
+            'transaction_count': self.transaction_count,
+            'total_credits': self.total_credits,
+            'total_debits': self.total_debits,
+            'net_total': self.net_total,
+            'transactions': self.transactions
+        }
+
+
+def _convert_to_mt940(job: tuple) -> str:
+    """Worker for process_files_to_mt940; module-level so it pickles."""
+    file_path, bank = job
+    return TransactionProcessor().process_file_to_mt940(file_path, bank)
 
 
 class TransactionProcessor:
@@ -15,8 +58,62 @@ class TransactionProcessor:
     
     def __init__(self):
         self.parser_factory = ParserFactory()
-        self.mt940_formatter = MT940Formatter()
-        self.camt053_formatter = CAMT053Formatter()
+        # Formatters are built lazily: summary/validation callers never
+        # need either, and MT940-only callers skip the CAMT import entirely
+        self._mt940_formatter = None
+        self._camt053_formatter = None
+        # Parsers are stateless with respect to a given file, so one
+        # instance per bank serves every conversion in this process
+        self._parser_cache = {}
+        # (path, mtime_ns, size, bank) -> (transactions, account_info);
+        # bounded LRU so producing both output formats parses once
+        self._load_cache = OrderedDict()
+
+    _LOAD_CACHE_SIZE = 8
+
+    @property
+    def mt940_formatter(self) -> MT940Formatter:
+        if self._mt940_formatter is None:
+            self._mt940_formatter = MT940Formatter()
+        return self._mt940_formatter
+
+    @property
+    def camt053_formatter(self):
+        if self._camt053_formatter is None:
+            from ..camt.formatter import CAMT053Formatter
+            self._camt053_formatter = CAMT053Formatter()
+        return self._camt053_formatter
+
+    def _load(self, file_path: str, bank: str) -> tuple:
+        """Parse a file once per on-disk version.
+
+        Returns (transactions, account_info, closing_memo); the memo maps an
+        opening balance to the closing balance computed from it, so rendering
+        a second output format skips the O(N) Decimal summation.
+        """
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size, bank)
+        cached = self._load_cache.get(key)
+        if cached is not None:
+            self._load_cache.move_to_end(key)
+        else:
+            parser = self._get_parser(bank)
+            transactions, account_info = parser.parse_with_info(file_path)
+            cached = (transactions, account_info, {})
+            self._load_cache[key] = cached
+            if len(self._load_cache) > self._LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
+        transactions, account_info, closing_memo = cached
+        # Shallow copy so callers may mutate their list freely
+        return list(transactions), account_info, closing_memo
+
+    def _get_parser(self, bank: str) -> BaseParser:
+        """Return a cached parser instance for the given bank."""
+        parser = self._parser_cache.get(bank)
+        if parser is None:
+            parser = self.parser_factory.create_parser(bank)
+            self._parser_cache[bank] = parser
+        return parser
     
     def process_file_to_mt940(
         self,
@@ -27,39 +124,9 @@ class TransactionProcessor:
         opening_balance: Optional[Decimal] = None
     ) -> str:
         """Process bank file and return MT940 formatted string."""
-        
-        # Get the appropriate parser for the bank
-        parser = self.parser_factory.create_parser(bank)
-        
-        # Parse file
-        transactions = parser.parse_file(file_path)
-        
-        # Get account info from file if not provided
-        account_info = parser.get_account_info(file_path)
-        
-        # Use provided values or defaults
-        final_account_number = account_number or account_info['account_number']
-        final_statement_number = statement_number or self._generate_statement_number(account_info['start_date'])
-        
-        # Calculate opening balance if not provided
-        if opening_balance is None:
-            opening_balance = self._calculate_opening_balance(transactions)
-        
-        # Calculate closing balance
-        closing_balance = self.mt940_formatter.calculate_closing_balance(opening_balance, transactions)
-        
-        # Create account statement
-        statement = AccountStatement(
-            account_number=final_account_number,
-            statement_number=final_statement_number,
-            opening_balance=opening_balance,
-            closing_balance=closing_balance,
-            transactions=transactions,
-            currency="EUR",
-            date=account_info['end_date']
+        statement = self._build_statement(
+            file_path, bank, account_number, statement_number, opening_balance
         )
-        
-        # Format as MT940
         return self.mt940_formatter.format_statement(statement)
     
     def process_file_to_camt053(
@@ -71,29 +138,66 @@ class TransactionProcessor:
         opening_balance: Optional[Decimal] = None
     ) -> str:
         """Process bank file and return CAMT.053 formatted XML string."""
-        
-        # Get the appropriate parser for the bank
-        parser = self.parser_factory.create_parser(bank)
-        
-        # Parse file
-        transactions = parser.parse_file(file_path)
-        
-        # Get account info from file if not provided
-        account_info = parser.get_account_info(file_path)
-        
+        statement = self._build_statement(
+            file_path, bank, account_number, statement_number, opening_balance
+        )
+        return self.camt053_formatter.format_statement(statement)
+
+    def process_files_to_mt940(self, jobs: List[tuple], max_workers: Optional[int] = None) -> List[str]:
+        """Convert many (file_path, bank) pairs to MT940 in parallel.
+
+        Parsing is CPU-bound and holds the GIL, so the fan-out uses worker
+        processes rather than threads; each worker builds its own processor.
+        Results come back in job order. Single jobs skip the pool entirely.
+        """
+        if len(jobs) <= 1:
+            return [self.process_file_to_mt940(file_path, bank) for file_path, bank in jobs]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_convert_to_mt940, jobs))
+
+    def _build_statement(
+        self,
+        file_path: str,
+        bank: str,
+        account_number: Optional[str] = None,
+        statement_number: Optional[str] = None,
+        opening_balance: Optional[Decimal] = None
+    ) -> AccountStatement:
+        """Parse a bank file and assemble the AccountStatement both formats share."""
+        transactions, account_info, closing_memo = self._load(file_path, bank)
+        return self._assemble_statement(
+            transactions, account_info, account_number, statement_number,
+            opening_balance, closing_memo
+        )
+
+    def _assemble_statement(
+        self,
+        transactions: List[Transaction],
+        account_info: dict,
+        account_number: Optional[str] = None,
+        statement_number: Optional[str] = None,
+        opening_balance: Optional[Decimal] = None,
+        closing_memo: Optional[dict] = None
+    ) -> AccountStatement:
+        """Build an AccountStatement from already-parsed transactions and info."""
         # Use provided values or defaults
         final_account_number = account_number or account_info['account_number']
         final_statement_number = statement_number or self._generate_statement_number(account_info['start_date'])
-        
+
         # Calculate opening balance if not provided
         if opening_balance is None:
             opening_balance = self._calculate_opening_balance(transactions)
-        
-        # Calculate closing balance
-        closing_balance = self.mt940_formatter.calculate_closing_balance(opening_balance, transactions)
-        
-        # Create account statement
-        statement = AccountStatement(
+
+        # Calculate closing balance, reusing a memoized result when the
+        # same parsed file is rendered in more than one output format
+        closing_balance = closing_memo.get(opening_balance) if closing_memo is not None else None
+        if closing_balance is None:
+            closing_balance = self.mt940_formatter.calculate_closing_balance(opening_balance, transactions)
+            if closing_memo is not None:
+                closing_memo[opening_balance] = closing_balance
+
+        return AccountStatement(
             account_number=final_account_number,
             statement_number=final_statement_number,
             opening_balance=opening_balance,
@@ -102,43 +206,61 @@ class TransactionProcessor:
             currency="EUR",
             date=account_info['end_date']
         )
-        
-        # Format as CAMT.053
-        return self.camt053_formatter.format_statement(statement)
     
-    def _generate_statement_number(self, start_date: datetime) -> str:
-        """Generate statement number based on date."""
-        return f"CC{start_date.strftime('%Y%m%d')}"
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_statement_number(start_date: datetime) -> str:
+        """Generate statement number based on date.
+
+        Memoized per distinct date; direct field formatting skips the
+        locale machinery strftime drags in.
+        """
+        return f"CC{start_date.year:04d}{start_date.month:02d}{start_date.day:02d}"
     
     def _calculate_opening_balance(self, transactions: List[Transaction]) -> Decimal:
         """Calculate opening balance - for credit card statements, typically 0."""
         # For credit card statements, we typically start with 0 balance
         # since we're only showing the transactions for the period
-        return Decimal('0.00')
+        return _ZERO_BALANCE
     
+    def summarize_file(self, file_path: str, bank: str) -> TransactionSummary:
+        """Summarize a bank file as a slotted TransactionSummary."""
+        transactions, account_info, _ = self._load(file_path, bank)
+        totals = self._get_parser(bank).calculate_totals(transactions)
+
+        return TransactionSummary(
+            account_number=account_info['account_number'],
+            start_date=account_info['start_date'],
+            end_date=account_info['end_date'],
+            transaction_count=totals['transaction_count'],
+            total_credits=totals['total_credits'],
+            total_debits=totals['total_debits'],
+            net_total=totals['net_total'],
+            transactions=transactions
+        )
+
     def get_transaction_summary(self, file_path: str, bank: str) -> dict:
-        """Get summary of transactions from bank file."""
-        parser = self.parser_factory.create_parser(bank)
-        transactions = parser.parse_file(file_path)
-        account_info = parser.get_account_info(file_path)
-        totals = parser.calculate_totals(transactions)
-        
-        return {
-            'account_number': account_info['account_number'],
-            'date_range': {
-                'start': account_info['start_date'],
-                'end': account_info['end_date']
-            },
-            'transaction_count': totals['transaction_count'],
-            'total_credits': totals['total_credits'],
-            'total_debits': totals['total_debits'],
-            'net_total': totals['net_total'],
-            'transactions': transactions
-        }
+        """Get summary of transactions from bank file as a dict."""
+        return self.summarize_file(file_path, bank).to_dict()
+
+    def batch_summaries(self, jobs: List[tuple], max_workers: Optional[int] = None) -> List[dict]:
+        """Summarize many (file_path, bank) pairs concurrently.
+
+        Summaries are dominated by file reads and decompression, which
+        release the GIL, so threads overlap the I/O without the pickling
+        cost of worker processes. Results come back in job order.
+        """
+        if len(jobs) <= 1:
+            return [self.get_transaction_summary(file_path, bank) for file_path, bank in jobs]
+
+        if max_workers is None:
+            max_workers = min(8, len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda job: self.get_transaction_summary(*job), jobs))
     
     def validate_file_format(self, file_path: str, bank: str) -> dict:
         """Validate bank file format and return validation results."""
-        parser = self.parser_factory.create_parser(bank)
+        parser = self._get_parser(bank)
         return parser.validate_file_format(file_path)
     
     def get_available_banks(self) -> dict:
@@ -150,49 +272,41 @@ class TransactionProcessor:
         return self.parser_factory.get_supported_file_types(bank)
     
     # Backward compatibility methods for existing code
-    def process_csv_to_mt940(
+    def _build_legacy_statement(
         self,
         file_path: str,
         account_number: Optional[str] = None,
         statement_number: Optional[str] = None,
         opening_balance: Optional[Decimal] = None
-    ) -> str:
-        """Legacy method - uses original CSV parser for exact compatibility."""
+    ) -> AccountStatement:
+        """Build a statement with the original CSV parser for exact compatibility.
+
+        The legacy parser reads the account number from the file itself and
+        is not registered in the factory, so this path bypasses _load and
+        shares only the assembly step with the bank-aware pipeline.
+        """
         # Import the original CSV parser to ensure exact same behavior
         from ..parsers.csv_parser import CSVParser
-        
-        # Use original CSV parser directly
+
         csv_parser = CSVParser()
-        transactions = csv_parser.parse_csv(file_path)
-        
-        # Get account info from CSV if not provided
-        account_info = csv_parser.get_account_info(file_path)
-        
-        # Use provided values or defaults
-        final_account_number = account_number or account_info['account_number']
-        final_statement_number = statement_number or self._generate_statement_number(account_info['start_date'])
-        
-        # Calculate opening balance if not provided
-        if opening_balance is None:
-            opening_balance = self._calculate_opening_balance(transactions)
-        
-        # Calculate closing balance
-        closing_balance = self.mt940_formatter.calculate_closing_balance(opening_balance, transactions)
-        
-        # Create account statement
-        statement = AccountStatement(
-            account_number=final_account_number,
-            statement_number=final_statement_number,
-            opening_balance=opening_balance,
-            closing_balance=closing_balance,
-            transactions=transactions,
-            currency="EUR",
-            date=account_info['end_date']
+        transactions, account_info = csv_parser.parse_with_info(file_path)
+        return self._assemble_statement(
+            transactions, account_info, account_number, statement_number, opening_balance
+        )
+
+    def process_csv_to_mt940(
+        self,
+        file_path: str,
+        account_number: Optional[str] = None,
+        statement_number: Optional[str] = None,
+        opening_balance: Optional[Decimal] = None
+    ) -> str:
+        """Legacy method - uses original CSV parser for exact compatibility."""
+        statement = self._build_legacy_statement(
+            file_path, account_number, statement_number, opening_balance
         )
-        
-        # Format as MT940
         return self.mt940_formatter.format_statement(statement)
-    
+
     def process_csv_to_camt053(
         self,
         file_path: str,
@@ -200,7 +314,8 @@ class TransactionProcessor:
         statement_number: Optional[str] = None,
         opening_balance: Optional[Decimal] = None
     ) -> str:
-        """Legacy method - defaults to Rabobank for backward compatibility."""
-        return self.process_file_to_camt053(
-            file_path, 'rabobank', account_number, statement_number, opening_balance
-        )
\ No newline at end of file
+        """Legacy method - uses original CSV parser for exact compatibility."""
+        statement = self._build_legacy_statement(
+            file_path, account_number, statement_number, opening_balance
+        )
+        return self.camt053_formatter.format_statement(statement)
\ No newline at end of file
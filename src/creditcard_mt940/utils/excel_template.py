@@ -1,9 +1,25 @@
 """Generate downloadable Excel template with dummy transactions."""
 
 import io
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import pandas as pd
+from openpyxl.utils import get_column_letter
+
+# Static example rows: (days before today, Bedrag, Omschrijving,
+# Tegenrekening, Referentie). Only the Datum depends on the call time.
+_DUMMY_TEMPLATE = (
+    (10, -49.99, "Albert Heijn - Boodschappen", "NL91ABNA0417164300", "AH-001"),
+    (8, -12.50, "Spotify Premium maandabonnement", "", "SPOTIFY-FEB"),
+    (5, 1500.00, "Salaris februari 2026", "NL20INGB0001234567", "SAL-2026-02"),
+    (3, -85.00, "Ziggo Internet & TV", "NL45RABO0123456789", ""),
+    (1, -29.99, "bol.com - Bestelling #9283746", "", "BOL-9283746"),
+)
+
+# The output only changes when the example dates roll over, so cache the
+# bytes per calendar day. Holds at most one entry; dict ops are
+# GIL-atomic, so no lock is needed.
+_template_cache: dict = {}
 
 
 def generate_template() -> bytes:
@@ -12,63 +28,49 @@ def generate_template() -> bytes:
     The template has 5 example rows so users understand the expected format.
     Users delete the examples, add their own transactions, and re-upload.
     """
+    cached = _template_cache.get(date.today())
+    if cached is not None:
+        return cached
+
     today = datetime.now()
 
     dummy_data = [
         {
-            "Datum": (today - timedelta(days=10)).strftime("%d-%m-%Y"),
-            "Bedrag": -49.99,
-            "Omschrijving": "Albert Heijn - Boodschappen",
-            "Tegenrekening": "NL91ABNA0417164300",
-            "Referentie": "AH-001",
-        },
-        {
-            "Datum": (today - timedelta(days=8)).strftime("%d-%m-%Y"),
-            "Bedrag": -12.50,
-            "Omschrijving": "Spotify Premium maandabonnement",
-            "Tegenrekening": "",
-            "Referentie": "SPOTIFY-FEB",
-        },
-        {
-            "Datum": (today - timedelta(days=5)).strftime("%d-%m-%Y"),
-            "Bedrag": 1500.00,
-            "Omschrijving": "Salaris februari 2026",
-            "Tegenrekening": "NL20INGB0001234567",
-            "Referentie": "SAL-2026-02",
-        },
-        {
-            "Datum": (today - timedelta(days=3)).strftime("%d-%m-%Y"),
-            "Bedrag": -85.00,
-            "Omschrijving": "Ziggo Internet & TV",
-            "Tegenrekening": "NL45RABO0123456789",
-            "Referentie": "",
-        },
-        {
-            "Datum": (today - timedelta(days=1)).strftime("%d-%m-%Y"),
-            "Bedrag": -29.99,
-            "Omschrijving": "bol.com - Bestelling #9283746",
-            "Tegenrekening": "",
-            "Referentie": "BOL-9283746",
-        },
+            "Datum": (today - timedelta(days=days)).strftime("%d-%m-%Y"),
+            "Bedrag": amount,
+            "Omschrijving": description,
+            "Tegenrekening": counter_account,
+            "Referentie": reference,
+        }
+        for days, amount, description, counter_account, reference in _DUMMY_TEMPLATE
     ]
 
     df = pd.DataFrame(dummy_data)
 
-    # Write to Excel in memory
+    # Write to Excel in memory. xlsxwriter streams cells straight to the
+    # zipped XML instead of building openpyxl's per-cell object graph, so
+    # prefer it when available and fall back to openpyxl otherwise.
+    try:
+        import xlsxwriter  # noqa: F401
+        engine = "xlsxwriter"
+    except ImportError:
+        engine = "openpyxl"
+
     buf = io.BytesIO()
-    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+    with pd.ExcelWriter(buf, engine=engine) as writer:
         df.to_excel(writer, index=False, sheet_name="Transacties")
 
-        # Auto-fit column widths
+        # Auto-fit column widths; one vectorized length reduction per
+        # column, and get_column_letter avoids touching header cells
         ws = writer.sheets["Transacties"]
         for col_idx, col_name in enumerate(df.columns, 1):
-            max_len = max(
-                len(str(col_name)),
-                *(len(str(v)) for v in df[col_name]),
-            )
-            ws.column_dimensions[
-                ws.cell(row=1, column=col_idx).column_letter
-            ].width = max_len + 4
+            max_len = max(len(str(col_name)), df[col_name].astype(str).str.len().max())
+            if engine == "xlsxwriter":
+                ws.set_column(col_idx - 1, col_idx - 1, max_len + 4)
+            else:
+                ws.column_dimensions[get_column_letter(col_idx)].width = max_len + 4
 
-    buf.seek(0)
-    return buf.getvalue()
+    data = buf.getvalue()
+    _template_cache.clear()
+    _template_cache[date.today()] = data
+    return data
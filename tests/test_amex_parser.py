@@ -1,5 +1,7 @@
 """Tests for AMEX parser."""
 
+import time
+
 import pytest
 from decimal import Decimal
 from datetime import datetime
@@ -8,76 +10,126 @@ from src.creditcard_mt940.mt940.formatter import Transaction
 import pandas as pd
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One shared parser; the tests only read from it."""
+    return AmexParser()
+
+
+@pytest.fixture(scope="session")
+def xlsx_files(tmp_path_factory):
+    """Write each test workbook exactly once for the whole test run.
+
+    Rebuilding these via df.to_excel in every test re-ran openpyxl
+    serialization per test; the parsers never mutate the files. An
+    in-memory BytesIO would skip the disk round-trip too, but
+    validate_file_format inspects the file extension, so the fixtures
+    stay real .xlsx paths serialized a single time per session.
+    """
+    directory = tmp_path_factory.mktemp("amex")
+
+    simple_df = pd.DataFrame({
+        'Date': ['2025-05-05', '2025-05-06'],
+        'Amount': ['-100.50', '-25.00'],
+        'Description': ['Store Purchase', 'Restaurant']
+    })
+    basic_df = pd.DataFrame({
+        'Date': ['2025-05-05', '2025-05-06'],
+        'Reference': ['REF001', 'REF002'],
+        'Bedrag': ['-100.50', '-25.00'],
+        'Description': ['Store Purchase', 'Restaurant']
+    })
+    payments_df = pd.DataFrame({
+        'Date': ['2025-05-05', '2025-05-06', '2025-05-07'],
+        'Reference': ['REF001', 'REF002', 'REF003'],
+        'Bedrag': ['-100.50', '-250.00', '-25.00'],
+        'Description': ['Store Purchase', 'HARTELIJK BEDANKT VOOR UW BETALING', 'Restaurant']
+    })
+    keywords_df = pd.DataFrame({
+        'Date': ['2025-05-05', '2025-05-06', '2025-05-07', '2025-05-08'],
+        'Reference': ['REF001', 'REF002', 'REF003', 'REF004'],
+        'Bedrag': ['-100.50', '-250.00', '-300.00', '-25.00'],
+        'Description': [
+            'Store Purchase',
+            'hartelijk bedankt voor uw betaling',  # lowercase
+            'DANK U VOOR UW BETALING',  # different phrase - should NOT be detected as payment
+            'Restaurant'
+        ]
+    })
+    # Simulating real AMEX format with metadata before the header row
+    header_detection_df = pd.DataFrame([
+        ['Transactieoverzicht', '', '', ''],
+        ['Voor', '', '', ''],
+        ['L LENARTS', '', '', ''],
+        ['Kaartnummer', '', '', ''],
+        ['xxxx-xxxxxx-x1234', '', '', ''],
+        ['', '', '', ''],
+        ['Datum', 'Omschrijving', 'Bedrag', 'Aanvullende informatie'],
+        ['01/05/2025', 'Store Purchase', -100.50, ''],
+        ['01/06/2025', 'Restaurant', -25.00, ''],
+    ])
+    missing_columns_df = pd.DataFrame({
+        'Date': ['2025-05-05', '2025-05-06'],
+        'Description': ['Store Purchase', 'Restaurant']
+        # Missing Amount column
+    })
+
+    files = {}
+    for name, df, kwargs in (
+        ('simple', simple_df, {}),
+        ('basic', basic_df, {}),
+        ('payments', payments_df, {}),
+        ('keywords', keywords_df, {}),
+        ('header_detection', header_detection_df, {'header': False}),
+        ('empty', pd.DataFrame(), {}),
+        ('missing_columns', missing_columns_df, {}),
+    ):
+        path = directory / f"{name}.xlsx"
+        df.to_excel(path, index=False, **kwargs)
+        files[name] = str(path)
+    return files
+
+
 class TestAmexParser:
     """Test cases for AmexParser."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = AmexParser()
-    
-    def test_get_bank_name(self):
+
+    def test_get_bank_name(self, parser):
         """Test bank name."""
-        assert self.parser.get_bank_name() == 'AMEX'
-    
-    def test_get_supported_file_types(self):
+        assert parser.get_bank_name() == 'AMEX'
+
+    def test_get_supported_file_types(self, parser):
         """Test supported file types."""
-        assert self.parser.get_supported_file_types() == ['xlsx', 'xls']
-    
-    def test_validate_file_format_valid(self, tmp_path):
+        assert parser.get_supported_file_types() == ['xlsx', 'xls']
+
+    def test_validate_file_format_valid(self, parser, xlsx_files):
         """Test validation with valid Excel file."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06'],
-            'Amount': ['-100.50', '-25.00'],
-            'Description': ['Store Purchase', 'Restaurant']
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        result = self.parser.validate_file_format(str(excel_file))
+        result = parser.validate_file_format(xlsx_files['simple'])
         assert result['valid'] is True
         assert 'AMEX' in result['message']
-    
-    def test_validate_file_format_invalid_extension(self, tmp_path):
+
+    def test_validate_file_format_invalid_extension(self, parser, tmp_path):
         """Test validation with invalid file extension."""
         csv_file = tmp_path / "test.csv"
         csv_file.write_text("dummy content", encoding='utf-8')
-        
-        result = self.parser.validate_file_format(str(csv_file))
+
+        result = parser.validate_file_format(str(csv_file))
         assert result['valid'] is False
         assert 'Excel' in result['error']
-    
-    def test_validate_file_format_empty_file(self, tmp_path):
+
+    def test_validate_file_format_empty_file(self, parser, xlsx_files):
         """Test validation with empty Excel file."""
-        df = pd.DataFrame()
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        result = self.parser.validate_file_format(str(excel_file))
+        result = parser.validate_file_format(xlsx_files['empty'])
         assert result['valid'] is False
         assert 'empty' in result['error']
-    
-    def test_parse_file_basic(self, tmp_path):
+
+    def test_parse_file_basic(self, parser, xlsx_files):
         """Test basic file parsing with proper column structure.
-        
+
         Note: _apply_amex_logic flips signs for regular transactions
         (negative becomes positive) and keeps TRANSFER type.
         """
-        data = {
-            'Date': ['2025-05-05', '2025-05-06'],
-            'Reference': ['REF001', 'REF002'],
-            'Bedrag': ['-100.50', '-25.00'],
-            'Description': ['Store Purchase', 'Restaurant']
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        transactions = self.parser.parse_file(str(excel_file))
-        
+        transactions = parser.parse_file(xlsx_files['basic'])
+
         assert len(transactions) == 2
         # _apply_amex_logic flips sign: -(-100.50) = 100.50
         assert transactions[0].amount == Decimal('100.5')
@@ -86,161 +138,139 @@ class TestAmexParser:
         assert transactions[0].counter_account == 'NL00AMEX0000000000'
         assert transactions[0].reference == '49000000001'
         assert transactions[0].transaction_type == 'TRANSFER'
-        
+
         assert transactions[1].amount == Decimal('25')
         assert transactions[1].description == 'Restaurant'
         assert transactions[1].date == datetime(2025, 5, 6)
         assert transactions[1].reference == '49000000002'
-    
-    def test_parse_file_with_payments(self, tmp_path):
+
+    def test_parse_file_with_payments(self, parser, xlsx_files):
         """Test parsing with payment transactions."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06', '2025-05-07'],
-            'Reference': ['REF001', 'REF002', 'REF003'],
-            'Bedrag': ['-100.50', '-250.00', '-25.00'],
-            'Description': ['Store Purchase', 'HARTELIJK BEDANKT VOOR UW BETALING', 'Restaurant']
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        transactions = self.parser.parse_file(str(excel_file))
-        
+        transactions = parser.parse_file(xlsx_files['payments'])
+
         assert len(transactions) == 3
         # Regular: sign flipped
         assert transactions[0].amount == Decimal('100.5')
         assert transactions[0].transaction_type == 'TRANSFER'
-        
+
         # Payment: abs value, CREDIT type
         assert transactions[1].amount == Decimal('250')
         assert transactions[1].description == 'HARTELIJK BEDANKT VOOR UW BETALING'
         assert transactions[1].transaction_type == 'CREDIT'
-        
+
         assert transactions[2].amount == Decimal('25')
         assert transactions[2].transaction_type == 'TRANSFER'
-    
-    def test_parse_file_with_different_payment_keywords(self, tmp_path):
+
+    def test_parse_file_with_different_payment_keywords(self, parser, xlsx_files):
         """Test parsing with different payment keywords."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06', '2025-05-07', '2025-05-08'],
-            'Reference': ['REF001', 'REF002', 'REF003', 'REF004'],
-            'Bedrag': ['-100.50', '-250.00', '-300.00', '-25.00'],
-            'Description': [
-                'Store Purchase', 
-                'hartelijk bedankt voor uw betaling',  # lowercase
-                'DANK U VOOR UW BETALING',  # different phrase - should NOT be detected as payment
-                'Restaurant'
-            ]
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        transactions = self.parser.parse_file(str(excel_file))
-        
+        transactions = parser.parse_file(xlsx_files['keywords'])
+
         assert len(transactions) == 4
         # Regular: sign flipped
         assert transactions[0].amount == Decimal('100.5')
         assert transactions[0].transaction_type == 'TRANSFER'
-        
+
         # Payment keyword match: abs value, CREDIT
         assert transactions[1].amount == Decimal('250')
         assert transactions[1].transaction_type == 'CREDIT'
-        
+
         # "DANK U VOOR UW BETALING" is NOT in payment_keywords, sign flipped like regular
         assert transactions[2].amount == Decimal('300')
         assert transactions[2].transaction_type == 'TRANSFER'
-        
+
         assert transactions[3].amount == Decimal('25')
         assert transactions[3].transaction_type == 'TRANSFER'
-    
-    def test_parse_file_with_header_detection(self, tmp_path):
+
+    def test_parse_file_with_header_detection(self, parser, xlsx_files):
         """Test parsing with header detection in Excel file."""
-        # Create Excel with metadata rows followed by actual data headers
-        # Simulating real AMEX format with metadata before the header row
-        rows = [
-            ['Transactieoverzicht', '', '', ''],
-            ['Voor', '', '', ''],
-            ['L LENARTS', '', '', ''],
-            ['Kaartnummer', '', '', ''],
-            ['xxxx-xxxxxx-x1234', '', '', ''],
-            ['', '', '', ''],
-            ['Datum', 'Omschrijving', 'Bedrag', 'Aanvullende informatie'],
-            ['01/05/2025', 'Store Purchase', -100.50, ''],
-            ['01/06/2025', 'Restaurant', -25.00, ''],
-        ]
-        df = pd.DataFrame(rows)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False, header=False)
-        
-        transactions = self.parser.parse_file(str(excel_file))
-        
+        transactions = parser.parse_file(xlsx_files['header_detection'])
+
         assert len(transactions) == 2
         assert transactions[0].description == 'Store Purchase'
         assert transactions[1].description == 'Restaurant'
-    
-    def test_get_account_info(self, tmp_path):
+
+    def test_get_account_info(self, parser, xlsx_files):
         """Test extracting account information."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06'],
-            'Amount': ['-100.50', '-25.00'],
-            'Description': ['Store Purchase', 'Restaurant']
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        account_info = self.parser.get_account_info(str(excel_file))
-        
+        account_info = parser.get_account_info(xlsx_files['simple'])
+
         assert account_info['account_number'] == 'NL00AMEX0000000000'
         assert account_info['start_date'] == datetime(2025, 5, 5)
         assert account_info['end_date'] == datetime(2025, 5, 6)
-    
-    def test_calculate_totals(self, tmp_path):
+
+    def test_calculate_totals(self, parser, xlsx_files):
         """Test calculating transaction totals."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06', '2025-05-07'],
-            'Reference': ['REF001', 'REF002', 'REF003'],
-            'Bedrag': ['-100.50', '-250.00', '-25.00'],
-            'Description': ['Store Purchase', 'HARTELIJK BEDANKT VOOR UW BETALING', 'Restaurant']
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
-        transactions = self.parser.parse_file(str(excel_file))
-        totals = self.parser.calculate_totals(transactions)
-        
+        transactions = parser.parse_file(xlsx_files['payments'])
+        totals = parser.calculate_totals(transactions)
+
         assert totals['transaction_count'] == 3
         # Payment: 250, Regular flipped: 100.5 + 25 = 125.5
         # All amounts are positive after _apply_amex_logic
         assert totals['total_credits'] == Decimal('250') + Decimal('100.5') + Decimal('25')
         assert totals['total_debits'] == Decimal('0')
         assert totals['net_total'] == Decimal('375.5')
-    
-    def test_apply_amex_logic(self):
+
+    def test_apply_amex_logic(self, parser):
         """Test AMEX-specific transaction logic."""
         # Test payment transaction: abs value, CREDIT
-        amount1, type1 = self.parser._apply_amex_logic(Decimal('-250.00'), 'HARTELIJK BEDANKT VOOR UW BETALING')
+        amount1, type1 = parser._apply_amex_logic(Decimal('-250.00'), 'HARTELIJK BEDANKT VOOR UW BETALING')
         assert amount1 == Decimal('250.00')
         assert type1 == 'CREDIT'
-        
+
         # Test regular transaction: sign flipped (- becomes +), TRANSFER
-        amount2, type2 = self.parser._apply_amex_logic(Decimal('-100.50'), 'Store Purchase')
+        amount2, type2 = parser._apply_amex_logic(Decimal('-100.50'), 'Store Purchase')
         assert amount2 == Decimal('100.50')
         assert type2 == 'TRANSFER'
-        
+
         # Test case insensitive payment detection
-        amount3, type3 = self.parser._apply_amex_logic(Decimal('-300.00'), 'hartelijk bedankt voor uw betaling')
+        amount3, type3 = parser._apply_amex_logic(Decimal('-300.00'), 'hartelijk bedankt voor uw betaling')
         assert amount3 == Decimal('300.00')
         assert type3 == 'CREDIT'
-    
-    def test_find_header_row(self):
+
+    def test_apply_amex_logic_regex_variants(self, parser):
+        """Test the compiled payment matcher against casing and embedding."""
+        # Mixed case still matches
+        amount, transaction_type = parser._apply_amex_logic(
+            Decimal('-50.00'), 'Hartelijk Bedankt Voor Uw Betaling'
+        )
+        assert amount == Decimal('50.00')
+        assert transaction_type == 'CREDIT'
+
+        # Phrase embedded in a longer description matches
+        amount, transaction_type = parser._apply_amex_logic(
+            Decimal('-75.00'), 'AMEX: hartelijk bedankt voor uw betaling - 05/2025'
+        )
+        assert amount == Decimal('75.00')
+        assert transaction_type == 'CREDIT'
+
+        # Partial phrase does not match
+        amount, transaction_type = parser._apply_amex_logic(
+            Decimal('-60.00'), 'bedankt voor uw bestelling'
+        )
+        assert amount == Decimal('60.00')
+        assert transaction_type == 'TRANSFER'
+
+    def test_apply_amex_logic_vectorized(self, parser):
+        """Test that the vectorized path matches the scalar logic elementwise."""
+        amounts = pd.Series([
+            Decimal('-250.00'), Decimal('-100.50'), Decimal('-300.00'), Decimal('25.00')
+        ])
+        descriptions = pd.Series([
+            'HARTELIJK BEDANKT VOOR UW BETALING',
+            'Store Purchase',
+            'hartelijk bedankt voor uw betaling',
+            'Refund'
+        ])
+
+        processed, types = parser._apply_amex_logic_vec(amounts, descriptions)
+
+        for i in range(len(amounts)):
+            expected_amount, expected_type = parser._apply_amex_logic(
+                amounts.iat[i], descriptions.iat[i]
+            )
+            assert processed.iat[i] == expected_amount
+            assert types.iat[i] == expected_type
+
+    def test_find_header_row(self, parser):
         """Test finding the header row in AMEX Excel data."""
         # Test DataFrame with header row containing known column names
         data = {
@@ -249,10 +279,10 @@ class TestAmexParser:
             'Col3': ['', '', 'Bedrag']
         }
         df = pd.DataFrame(data)
-        
-        header_row = self.parser._find_header_row(df)
+
+        header_row = parser._find_header_row(df)
         assert header_row == 2  # 'Datum' found at row 2
-        
+
         # Test DataFrame where headers are in the first row
         data2 = {
             'Col1': ['Date', '2025-05-05'],
@@ -260,68 +290,91 @@ class TestAmexParser:
             'Col3': ['Description', 'Store']
         }
         df2 = pd.DataFrame(data2)
-        header_row2 = self.parser._find_header_row(df2)
+        header_row2 = parser._find_header_row(df2)
         assert header_row2 == 0
-    
-    def test_parse_date_formats(self):
+
+    def test_parse_date_formats(self, parser):
         """Test parsing various date formats."""
-        date1 = self.parser._parse_date('2025-05-05')
+        date1 = parser._parse_date('2025-05-05')
         assert date1 == datetime(2025, 5, 5)
-        
-        date2 = self.parser._parse_date('05/05/2025')
+
+        date2 = parser._parse_date('05/05/2025')
         assert date2 == datetime(2025, 5, 5)
-        
-        date3 = self.parser._parse_date('05-05-2025')
+
+        date3 = parser._parse_date('05-05-2025')
         assert date3 == datetime(2025, 5, 5)
-        
+
         # Test pandas timestamp
         timestamp = pd.Timestamp('2025-05-05')
-        date4 = self.parser._parse_date(timestamp)
+        date4 = parser._parse_date(timestamp)
         assert date4 == datetime(2025, 5, 5)
-    
-    def test_clean_amount_formats(self):
+
+    def test_clean_amount_formats(self, parser):
         """Test cleaning various amount formats."""
-        assert self.parser._clean_amount('-100.50') == Decimal('-100.50')
-        assert self.parser._clean_amount('50.00') == Decimal('50.00')
-        assert self.parser._clean_amount('-25,50') == Decimal('-25.50')
-        assert self.parser._clean_amount('€ 100.50') == Decimal('100.50')
-        assert self.parser._clean_amount('$ -75.25') == Decimal('-75.25')
-        
+        assert parser._clean_amount('-100.50') == Decimal('-100.50')
+        assert parser._clean_amount('50.00') == Decimal('50.00')
+        assert parser._clean_amount('-25,50') == Decimal('-25.50')
+        assert parser._clean_amount('€ 100.50') == Decimal('100.50')
+        assert parser._clean_amount('$ -75.25') == Decimal('-75.25')
+
         # Test invalid amount
         with pytest.raises(ValueError):
-            self.parser._clean_amount('invalid')
-    
-    def test_generate_reference_id(self):
+            parser._clean_amount('invalid')
+
+    def test_clean_amount_series(self, parser):
+        """Test that the batched cleaner matches _clean_amount per element."""
+        values = ['-100.50', '50.00', '-25,50', '€ 100.50', '$ -75.25', 'invalid']
+        results = parser._clean_amount_series(pd.Series(values))
+
+        for value, result in zip(values[:-1], results[:-1]):
+            assert result == parser._clean_amount(value)
+
+        # Unparseable entries become None instead of raising
+        assert results[-1] is None
+
+    def test_generate_reference_id(self, parser):
         """Test reference ID generation."""
-        ref1 = self.parser._generate_reference_id(datetime(2025, 5, 5), 1)
+        ref1 = parser._generate_reference_id(datetime(2025, 5, 5), 1)
         assert ref1 == '49000000001'
-        
-        ref2 = self.parser._generate_reference_id(datetime(2024, 12, 31), 999)
+
+        ref2 = parser._generate_reference_id(datetime(2024, 12, 31), 999)
         assert ref2 == '49000000999'
-    
-    def test_parse_empty_file(self, tmp_path):
+
+    def test_parse_empty_file(self, parser, xlsx_files):
         """Test parsing empty Excel file returns empty list."""
-        df = pd.DataFrame()
-        
-        excel_file = tmp_path / "test.xlsx"
-        df.to_excel(excel_file, index=False)
-        
         # Parser returns empty list for empty files (no ValueError raised)
-        transactions = self.parser.parse_file(str(excel_file))
+        transactions = parser.parse_file(xlsx_files['empty'])
         assert len(transactions) == 0
-    
-    def test_parse_file_with_missing_columns(self, tmp_path):
-        """Test parsing file with missing required columns returns empty list."""
-        data = {
-            'Date': ['2025-05-05', '2025-05-06'],
-            'Description': ['Store Purchase', 'Restaurant']
-            # Missing Amount column
-        }
-        df = pd.DataFrame(data)
-        
-        excel_file = tmp_path / "test.xlsx"
+
+    @pytest.mark.perf
+    def test_parse_file_large_batch(self, parser, tmp_path):
+        """Test that a 10k-row statement parses in bounded time.
+
+        The functional tests never exceed a few rows, so a regression
+        from the vectorized cleaning back to per-row parsing would go
+        unnoticed without a size-scaled check. The threshold is generous
+        (the parse takes well under 2 seconds here) to stay robust on
+        slow CI machines.
+        """
+        n = 10_000
+        df = pd.DataFrame({
+            'Date': pd.date_range('2025-01-01', periods=n).strftime('%Y-%m-%d'),
+            'Reference': [f'R{i}' for i in range(n)],
+            'Bedrag': ['-1.23'] * n,
+            'Description': ['X'] * n,
+        })
+        excel_file = tmp_path / "big.xlsx"
         df.to_excel(excel_file, index=False)
-        
+
+        start = time.perf_counter()
+        transactions = parser.parse_file(str(excel_file))
+        elapsed = time.perf_counter() - start
+
+        assert len(transactions) == n
+        assert elapsed < 15.0
+
+    def test_parse_file_with_missing_columns(self, parser, xlsx_files):
+        """Test parsing file with missing required columns returns empty list."""
         # Parser gracefully returns empty list when it can't parse transactions
-        transactions = self.parser.parse_file(str(excel_file))
+        transactions = parser.parse_file(xlsx_files['missing_columns'])
         assert len(transactions) == 0